@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Iterator, Literal
 
 import numpy as np
 from PIL import Image
@@ -18,6 +18,7 @@ from invokeai.backend.tiles.tiles import (
     calc_tiles_even_split,
     calc_tiles_min_overlap,
     calc_tiles_with_overlap,
+    merge_tiles_with_gaussian_blending,
     merge_tiles_with_linear_blending,
     merge_tiles_with_seam_blending,
 )
@@ -221,7 +222,7 @@ class PairTileImageInvocation(BaseInvocation):
         )
 
 
-BLEND_MODES = Literal["Linear", "Seam"]
+BLEND_MODES = Literal["Linear", "Seam", "Gaussian"]
 
 
 @invocation(
@@ -229,7 +230,7 @@ BLEND_MODES = Literal["Linear", "Seam"]
     title="Merge Tiles to Image",
     tags=["tiles"],
     category="tiles",
-    version="1.1.1",
+    version="1.2.0",
     classification=Classification.Beta,
 )
 class MergeTilesToImageInvocation(BaseInvocation, WithMetadata, WithBoard):
@@ -239,13 +240,13 @@ class MergeTilesToImageInvocation(BaseInvocation, WithMetadata, WithBoard):
     tiles_with_images: list[TileWithImage] = InputField(description="A list of tile images with tile properties.")
     blend_mode: BLEND_MODES = InputField(
         default="Seam",
-        description="blending type Linear or Seam",
+        description="blending type Linear, Seam or Gaussian",
         input=Input.Direct,
     )
     blend_amount: int = InputField(
         default=32,
         ge=0,
-        description="The amount to blend adjacent tiles in pixels. Must be <= the amount of overlap between adjacent tiles.",
+        description="The amount to blend adjacent tiles in pixels. Must be <= the amount of overlap between adjacent tiles. Not used by the Gaussian blend mode.",
     )
 
     def invoke(self, context: InvocationContext) -> ImageOutput:
@@ -259,28 +260,29 @@ class MergeTilesToImageInvocation(BaseInvocation, WithMetadata, WithBoard):
             height = max(height, tile.coords.bottom)
             width = max(width, tile.coords.right)
 
-        # Get all tile images for processing.
         # TODO(ryand): It pains me that we spend time PNG decoding each tile from disk when they almost certainly
         # existed in memory at an earlier point in the graph.
-        tile_np_images: list[np.ndarray] = []
-        for image in images:
-            pil_image = context.images.get_pil(image.image_name)
-            pil_image = pil_image.convert("RGB")
-            tile_np_images.append(np.array(pil_image))
-
-        # Prepare the output image buffer.
-        # Check the first tile to determine how many image channels are expected in the output.
-        channels = tile_np_images[0].shape[-1]
-        dtype = tile_np_images[0].dtype
-        np_image = np.zeros(shape=(height, width, channels), dtype=dtype)
+        def decode_tile_images() -> Iterator[np.ndarray]:
+            for image in images:
+                # Passing mode="RGB" skips the conversion (and its full-image copy) when the stored image is already
+                # RGB.
+                pil_image = context.images.get_pil(image.image_name, mode="RGB")
+                yield np.array(pil_image)
+
+        # Prepare the output image buffer. All tiles are decoded as RGB, so the output has 3 uint8 channels.
+        np_image = np.zeros(shape=(height, width, 3), dtype=np.uint8)
         if self.blend_mode == "Linear":
             merge_tiles_with_linear_blending(
-                dst_image=np_image, tiles=tiles, tile_images=tile_np_images, blend_amount=self.blend_amount
+                dst_image=np_image, tiles=tiles, tile_images=list(decode_tile_images()), blend_amount=self.blend_amount
             )
         elif self.blend_mode == "Seam":
             merge_tiles_with_seam_blending(
-                dst_image=np_image, tiles=tiles, tile_images=tile_np_images, blend_amount=self.blend_amount
+                dst_image=np_image, tiles=tiles, tile_images=list(decode_tile_images()), blend_amount=self.blend_amount
             )
+        elif self.blend_mode == "Gaussian":
+            # Gaussian blending accumulates each tile independently, so the tiles are decoded lazily: peak memory
+            # holds a single decoded tile rather than all of them.
+            merge_tiles_with_gaussian_blending(dst_image=np_image, tiles=tiles, tile_images=decode_tile_images())
         else:
             raise ValueError(f"Unsupported blend mode: '{self.blend_mode}'.")
 
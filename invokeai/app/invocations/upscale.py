@@ -3,6 +3,7 @@ from typing import Literal
 
 import cv2
 import numpy as np
+import torch
 from PIL import Image
 from pydantic import ConfigDict
 
@@ -11,6 +12,7 @@ from invokeai.app.invocations.primitives import ImageOutput
 from invokeai.app.services.shared.invocation_context import InvocationContext
 from invokeai.backend.image_util.basicsr.rrdbnet_arch import RRDBNet
 from invokeai.backend.image_util.realesrgan.realesrgan import RealESRGAN
+from invokeai.backend.util.devices import TorchDevice
 
 from .baseinvocation import BaseInvocation, invocation
 from .fields import InputField, WithBoard, WithMetadata
@@ -31,8 +33,17 @@ ESRGAN_MODEL_URLS: dict[str, str] = {
     "RealESRGAN_x2plus.pth": "https://github.com/xinntao/Real-ESRGAN/releases/download/v0.2.1/RealESRGAN_x2plus.pth",
 }
 
+# RRDBNet architecture parameters (num_block, netscale) for each supported model. All models share the remaining
+# RRDBNet parameters.
+ESRGAN_MODEL_PARAMS: dict[str, tuple[int, int]] = {
+    "RealESRGAN_x4plus.pth": (23, 4),
+    "RealESRGAN_x4plus_anime_6B.pth": (6, 4),
+    "ESRGAN_SRx4_DF2KOST_official-ff704c30.pth": (23, 4),
+    "RealESRGAN_x2plus.pth": (23, 2),
+}
+
 
-@invocation("esrgan", title="Upscale (RealESRGAN)", tags=["esrgan", "upscale"], category="esrgan", version="1.3.2")
+@invocation("esrgan", title="Upscale (RealESRGAN)", tags=["esrgan", "upscale"], category="esrgan", version="1.3.4")
 class ESRGANInvocation(BaseInvocation, WithMetadata, WithBoard):
     """Upscales an image using RealESRGAN."""
 
@@ -47,69 +58,45 @@ class ESRGANInvocation(BaseInvocation, WithMetadata, WithBoard):
     def invoke(self, context: InvocationContext) -> ImageOutput:
         image = context.images.get_pil(self.image.image_name)
 
-        rrdbnet_model = None
-        netscale = None
-
-        if self.model_name in [
-            "RealESRGAN_x4plus.pth",
-            "ESRGAN_SRx4_DF2KOST_official-ff704c30.pth",
-        ]:
-            # x4 RRDBNet model
-            rrdbnet_model = RRDBNet(
-                num_in_ch=3,
-                num_out_ch=3,
-                num_feat=64,
-                num_block=23,
-                num_grow_ch=32,
-                scale=4,
-            )
-            netscale = 4
-        elif self.model_name in ["RealESRGAN_x4plus_anime_6B.pth"]:
-            # x4 RRDBNet model, 6 blocks
-            rrdbnet_model = RRDBNet(
-                num_in_ch=3,
-                num_out_ch=3,
-                num_feat=64,
-                num_block=6,  # 6 blocks
-                num_grow_ch=32,
-                scale=4,
-            )
-            netscale = 4
-        elif self.model_name in ["RealESRGAN_x2plus.pth"]:
-            # x2 RRDBNet model
-            rrdbnet_model = RRDBNet(
-                num_in_ch=3,
-                num_out_ch=3,
-                num_feat=64,
-                num_block=23,
-                num_grow_ch=32,
-                scale=2,
-            )
-            netscale = 2
-        else:
+        model_params = ESRGAN_MODEL_PARAMS.get(self.model_name, None)
+        if model_params is None:
             msg = f"Invalid RealESRGAN model: {self.model_name}"
             context.logger.error(msg)
             raise ValueError(msg)
+        num_block, netscale = model_params
+
+        rrdbnet_model = RRDBNet(
+            num_in_ch=3,
+            num_out_ch=3,
+            num_feat=64,
+            num_block=num_block,
+            num_grow_ch=32,
+            scale=netscale,
+        )
 
         loadnet = context.models.load_remote_model(
             source=ESRGAN_MODEL_URLS[self.model_name],
         )
 
         with loadnet as loadnet_model:
+            # Run the RRDBNet in fp16 when the configured precision allows it. TorchDevice accounts for the user's
+            # precision setting and for GPUs with poor fp16 support.
             upscaler = RealESRGAN(
                 scale=netscale,
                 loadnet=loadnet_model,
                 model=rrdbnet_model,
-                half=False,
+                half=TorchDevice.choose_torch_dtype() == torch.float16,
                 tile=self.tile_size,
             )
 
             # prepare image - Real-ESRGAN uses cv2 internally, and cv2 uses BGR vs RGB for PIL
             # TODO: This strips the alpha... is that okay?
-            cv2_image = cv2.cvtColor(np.array(image.convert("RGB")), cv2.COLOR_RGB2BGR)
+            if image.mode != "RGB":
+                image = image.convert("RGB")
+            cv2_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
             upscaled_image = upscaler.upscale(cv2_image)
 
-            pil_image = Image.fromarray(cv2.cvtColor(upscaled_image, cv2.COLOR_BGR2RGB)).convert("RGBA")
+            pil_image = Image.fromarray(cv2.cvtColor(upscaled_image, cv2.COLOR_BGR2RGB))
 
         image_dto = context.images.save(image=pil_image)
 
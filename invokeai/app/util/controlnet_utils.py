@@ -319,13 +319,12 @@ def prepare_control_image(
         torch.Tensor: The pre-processed input tensor.
     """
     if resize_mode == "just_resize_simple":
-        image = image.convert("RGB")
+        if image.mode != "RGB":
+            image = image.convert("RGB")
         image = image.resize((width, height), resample=Image.LANCZOS)
-        nimage = np.array(image)
-        nimage = nimage[None, :]
-        nimage = np.concatenate([nimage], axis=0)
+        nimage = np.array(image)[None, :]
         # normalizing RGB values to [0,1] range (in PIL.Image they are [0-255])
-        nimage = np.array(nimage).astype(np.float32) / 255.0
+        nimage = nimage.astype(np.float32) / 255.0
         nimage = nimage.transpose(0, 3, 1, 2)
         timage = torch.from_numpy(nimage)
 
@@ -59,22 +59,22 @@ def retrieve_metadata(img_path):
     Given a path to a PNG image, returns the "sd-metadata"
     metadata stored there, as a dict
     """
-    im = Image.open(img_path)
-    if hasattr(im, "text"):
-        md = im.text.get("sd-metadata", "{}")
-        dream_prompt = im.text.get("Dream", "")
-    else:
-        # When trying to retrieve metadata from images without a 'text' payload, such as JPG images.
-        md = "{}"
-        dream_prompt = ""
+    with Image.open(img_path) as im:
+        if hasattr(im, "text"):
+            md = im.text.get("sd-metadata", "{}")
+            dream_prompt = im.text.get("Dream", "")
+        else:
+            # When trying to retrieve metadata from images without a 'text' payload, such as JPG images.
+            md = "{}"
+            dream_prompt = ""
     return {"sd-metadata": json.loads(md), "Dream": dream_prompt}
 
 
 def write_metadata(img_path: str, meta: dict):
-    im = Image.open(img_path)
-    info = PngImagePlugin.PngInfo()
-    info.add_text("sd-metadata", json.dumps(meta))
-    im.save(img_path, "PNG", pnginfo=info)
+    with Image.open(img_path) as im:
+        info = PngImagePlugin.PngInfo()
+        info.add_text("sd-metadata", json.dumps(meta))
+        im.save(img_path, "PNG", pnginfo=info)
 
 
 class PromptFormatter:
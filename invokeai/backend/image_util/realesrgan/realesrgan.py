@@ -80,10 +80,15 @@ class RealESRGAN:
         if self.half:
             self.model = self.model.half()
 
-    def pre_process(self, img: MatLike) -> None:
-        """Pre-process, such as pre-pad and mod pad, so that the images can be divisible"""
-        img_tensor: torch.Tensor = torch.from_numpy(np.transpose(img, (2, 0, 1))).float()
-        self.img = img_tensor.unsqueeze(0).to(self.device)
+    def pre_process(self, img: MatLike, max_range: float) -> None:
+        """Pre-process, such as normalization, pre-pad and mod pad, so that the images can be divisible.
+
+        The input image is uploaded to the target device in its original dtype, and the HWC->CHW transpose,
+        float conversion and normalization by `max_range` all run as device-side ops. This avoids materializing
+        a float32 copy of the image (3-4x the bytes of a uint8 source) in CPU memory.
+        """
+        img_tensor: torch.Tensor = torch.from_numpy(img).to(self.device)
+        self.img = img_tensor.permute(2, 0, 1).unsqueeze(0).float().div_(max_range)
         if self.half:
             self.img = self.img.half()
 
@@ -155,8 +160,7 @@ class RealESRGAN:
             ]
 
             # upscale tile
-            with torch.no_grad():
-                output_tile = self.model(input_tile)
+            output_tile = self.model(input_tile)
 
             # output tile area on total image
             output_start_x = input_start_x * self.scale
@@ -199,16 +203,15 @@ class RealESRGAN:
             ]
         return self.output
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def upscale(self, img: MatLike, esrgan_alpha_upscale: bool = True) -> npt.NDArray[Any]:
-        np_img = img.astype(np.float32)
+        np_img = img
         alpha: Optional[np.ndarray] = None
         if np.max(np_img) > 256:
             # 16-bit image
             max_range = 65535
         else:
             max_range = 255
-        np_img = np_img / max_range
         if len(np_img.shape) == 2:
             # grayscale image
             img_mode = ImageMode.L
@@ -226,14 +229,20 @@ class RealESRGAN:
             np_img = cv2.cvtColor(np_img, cv2.COLOR_BGR2RGB)
 
         # ------------------- process image (without the alpha channel) ------------------- #
-        self.pre_process(np_img)
+        self.pre_process(np_img, max_range)
         if self.tile_size > 0:
             self.tile_process()
         else:
             self.process()
         output_tensor = self.post_process()
-        output_img: npt.NDArray[Any] = output_tensor.data.squeeze().float().cpu().clamp_(0, 1).numpy()
-        output_img = np.transpose(output_img[[2, 1, 0], :, :], (1, 2, 0))
+        # The padded input tensor is no longer needed once inference has run. Drop it so it is freed before the
+        # (scale^2 times larger) output is converted below, reducing peak device memory.
+        del self.img
+        # Clamp, flip RGB->BGR and transpose to HWC on the device so that a single contiguous buffer is copied back
+        # to the host, instead of post-processing the raw CHW copy with NumPy passes.
+        output_img: npt.NDArray[Any] = (
+            output_tensor.data.squeeze().float().clamp(0, 1).flip(0).permute(1, 2, 0).contiguous().cpu().numpy()
+        )
         if img_mode is ImageMode.L:
             output_img = cv2.cvtColor(output_img, cv2.COLOR_BGR2GRAY)
 
@@ -241,14 +250,15 @@ class RealESRGAN:
         if img_mode is ImageMode.RGBA:
             if esrgan_alpha_upscale:
                 assert alpha is not None
-                self.pre_process(alpha)
+                self.pre_process(alpha, max_range)
                 if self.tile_size > 0:
                     self.tile_process()
                 else:
                     self.process()
                 output_alpha_tensor = self.post_process()
-                output_alpha: npt.NDArray[Any] = output_alpha_tensor.data.squeeze().float().cpu().clamp_(0, 1).numpy()
-                output_alpha = np.transpose(output_alpha[[2, 1, 0], :, :], (1, 2, 0))
+                del self.img
+                output_alpha_tensor = output_alpha_tensor.data.squeeze().float().clamp(0, 1)
+                output_alpha: npt.NDArray[Any] = output_alpha_tensor.flip(0).permute(1, 2, 0).contiguous().cpu().numpy()
                 output_alpha = cv2.cvtColor(output_alpha, cv2.COLOR_BGR2GRAY)
             else:  # use the cv2 resize for alpha channel
                 assert alpha is not None
@@ -258,6 +268,8 @@ class RealESRGAN:
                     (w * self.scale, h * self.scale),
                     interpolation=cv2.INTER_LINEAR,
                 )
+                # The alpha channel did not go through pre_process, so normalize it here.
+                output_alpha = output_alpha.astype(np.float32) / max_range
 
             # merge the alpha channel
             output_img = cv2.cvtColor(output_img, cv2.COLOR_BGR2BGRA)
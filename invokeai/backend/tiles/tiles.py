@@ -1,5 +1,6 @@
 import math
-from typing import Union
+from functools import lru_cache
+from typing import Iterable, Union
 
 import numpy as np
 
@@ -144,25 +145,23 @@ def calc_tiles_even_split(
     # tiles[y * num_tiles_x + x] is the tile for the y'th row, x'th column.
     tiles: list[Tile] = []
 
+    # Calculate the tile corners once per axis rather than once per tile. The last tile on each axis is aligned with
+    # the image edge.
+    tops = [tile_idx_y * (tile_size_y - overlap) for tile_idx_y in range(num_tiles_y)]
+    bottoms = [min(top + tile_size_y, image_height) for top in tops[:-1]] + [image_height]
+    lefts = [tile_idx_x * (tile_size_x - overlap) for tile_idx_x in range(num_tiles_x)]
+    rights = [min(left + tile_size_x, image_width) for left in lefts[:-1]] + [image_width]
+
     # Calculate tile coordinates. (Ignore overlap values for now.)
     for tile_idx_y in range(num_tiles_y):
-        # Calculate the top and bottom of the row
-        top = tile_idx_y * (tile_size_y - overlap)
-        bottom = min(top + tile_size_y, image_height)
-        # For the last row adjust bottom to be the height of the image
-        if tile_idx_y == num_tiles_y - 1:
-            bottom = image_height
-
         for tile_idx_x in range(num_tiles_x):
-            # Calculate the left & right coordinate of each tile
-            left = tile_idx_x * (tile_size_x - overlap)
-            right = min(left + tile_size_x, image_width)
-            # For the last tile in the row adjust right to be the width of the image
-            if tile_idx_x == num_tiles_x - 1:
-                right = image_width
-
             tile = Tile(
-                coords=TBLR(top=top, bottom=bottom, left=left, right=right),
+                coords=TBLR(
+                    top=tops[tile_idx_y],
+                    bottom=bottoms[tile_idx_y],
+                    left=lefts[tile_idx_x],
+                    right=rights[tile_idx_x],
+                ),
                 overlap=TBLR(top=0, bottom=0, left=0, right=0),
             )
 
@@ -208,13 +207,18 @@ def calc_tiles_min_overlap(
     # tiles[y * num_tiles_x + x] is the tile for the y'th row, x'th column.
     tiles: list[Tile] = []
 
+    # The left coordinates do not depend on the row, so calculate them once and reuse them for every row.
+    lefts = [
+        (tile_idx_x * (image_width - tile_width)) // (num_tiles_x - 1) if num_tiles_x > 1 else 0
+        for tile_idx_x in range(num_tiles_x)
+    ]
+
     # Calculate tile coordinates. (Ignore overlap values for now.)
     for tile_idx_y in range(num_tiles_y):
         top = (tile_idx_y * (image_height - tile_height)) // (num_tiles_y - 1) if num_tiles_y > 1 else 0
         bottom = top + tile_height
 
-        for tile_idx_x in range(num_tiles_x):
-            left = (tile_idx_x * (image_width - tile_width)) // (num_tiles_x - 1) if num_tiles_x > 1 else 0
+        for left in lefts:
             right = left + tile_width
 
             tile = Tile(
@@ -227,6 +231,49 @@ def calc_tiles_min_overlap(
     return calc_overlap(tiles, num_tiles_x, num_tiles_y)
 
 
+@lru_cache(maxsize=8)
+def _get_linear_blend_mask(
+    mask_height: int, mask_width: int, overlap: int, blend_amount: int, x_blend: bool
+) -> np.ndarray:
+    """Build a mask that applies a linear blend gradient to the left (x_blend=True) or top (x_blend=False) edge of a
+    tile or row of tiles.
+
+    The blend gradient is centered at the halfway point of the overlap with the neighboring tile/row. In the common
+    case, all tiles in a merge (and across repeated merges of the same shape) share the same mask, so the masks are
+    cached to avoid rebuilding them for every tile.
+
+    Args:
+        mask_height (int): The mask height in px.
+        mask_width (int): The mask width in px.
+        overlap (int): The overlap (in px) with the left/top neighbor. If 0, no blending is applied.
+        blend_amount (int): The amount of blending (in px) between adjacent overlapping tiles.
+        x_blend (bool): If True, the blend gradient runs along the x-axis, otherwise along the y-axis.
+
+    Returns:
+        np.ndarray: The mask. Range: [0.0, 1.0], Shape: (mask_height, mask_width).
+    """
+    mask = np.ones(shape=(mask_height, mask_width), dtype=np.float64)
+
+    if overlap > 0:
+        gradient = np.linspace(start=0.0, stop=1.0, num=blend_amount)
+        # Center the blending gradient in the middle of the overlap.
+        blend_start = overlap // 2 - blend_amount // 2
+        if x_blend:
+            # The region left of the blending region is masked completely.
+            mask[:, :blend_start] = 0.0
+            mask[:, blend_start : blend_start + blend_amount] = gradient
+        else:
+            # The region above the blending region is masked completely.
+            mask[:blend_start, :] = 0.0
+            # Convert shape: (blend_amount, ) -> (blend_amount, 1) so that the gradient is applied to a 2D mask via
+            # broadcasting.
+            mask[blend_start : blend_start + blend_amount, :] = np.expand_dims(gradient, axis=1)
+
+    # The mask is shared across calls, so guard against accidental mutation by callers.
+    mask.flags.writeable = False
+    return mask
+
+
 def merge_tiles_with_linear_blending(
     dst_image: np.ndarray, tiles: list[Tile], tile_images: list[np.ndarray], blend_amount: int
 ):
@@ -269,14 +316,6 @@ def merge_tiles_with_linear_blending(
         cur_tile_and_image_row.append(tile_and_image)
     tile_and_image_rows.append(cur_tile_and_image_row)
 
-    # Prepare 1D linear gradients for blending.
-    gradient_left_x = np.linspace(start=0.0, stop=1.0, num=blend_amount)
-    gradient_top_y = np.linspace(start=0.0, stop=1.0, num=blend_amount)
-    # Convert shape: (blend_amount, ) -> (blend_amount, 1). The extra dimension enables the gradient to be applied
-    # to a 2D image via broadcasting. Note that no additional dimension is needed on gradient_left_x for
-    # broadcasting to work correctly.
-    gradient_top_y = np.expand_dims(gradient_top_y, axis=1)
-
     for tile_and_image_row in tile_and_image_rows:
         first_tile_in_row, _ = tile_and_image_row[0]
         row_height = first_tile_in_row.coords.bottom - first_tile_in_row.coords.top
@@ -284,23 +323,18 @@ def merge_tiles_with_linear_blending(
 
         # Blend the tiles in the row horizontally.
         for tile, tile_image in tile_and_image_row:
-            # We expect the tiles to be ordered left-to-right. For each tile, we construct a mask that applies linear
+            # We expect the tiles to be ordered left-to-right. For each tile, we look up a mask that applies linear
             # blending to the left of the current tile. The inverse linear blending is automatically applied to the
             # right of the tiles that have already been pasted by the paste(...) operation.
             tile_height, tile_width, _ = tile_image.shape
-            mask = np.ones(shape=(tile_height, tile_width), dtype=np.float64)
 
             # Left blending:
+            # Tiles with no left overlap are fully opaque, so skip the blend (a full float multiply pass over the
+            # tile) and let paste(...) copy the tile directly.
+            mask = None
             if tile.overlap.left > 0:
                 assert tile.overlap.left >= blend_amount
-                # Center the blending gradient in the middle of the overlap.
-                blend_start_left = tile.overlap.left // 2 - blend_amount // 2
-                # The region left of the blending region is masked completely.
-                mask[:, :blend_start_left] = 0.0
-                # Apply the blend gradient to the mask.
-                mask[:, blend_start_left : blend_start_left + blend_amount] = gradient_left_x
-                # For visual debugging:
-                # tile_image[:, blend_start_left : blend_start_left + blend_amount] = 0
+                mask = _get_linear_blend_mask(tile_height, tile_width, tile.overlap.left, blend_amount, x_blend=True)
 
             paste(
                 dst_image=row_image,
@@ -312,19 +346,17 @@ def merge_tiles_with_linear_blending(
             )
 
         # Blend the row into the dst_image vertically.
-        # We construct a mask that applies linear blending to the top of the current row. The inverse linear blending is
+        # We look up a mask that applies linear blending to the top of the current row. The inverse linear blending is
         # automatically applied to the bottom of the tiles that have already been pasted by the paste(...) operation.
-        mask = np.ones(shape=(row_image.shape[0], row_image.shape[1]), dtype=np.float64)
         # Top blending:
-        # (See comments under 'Left blending' for an explanation of the logic.)
-        # We assume that the entire row has the same vertical overlaps as the first_tile_in_row.
+        # We assume that the entire row has the same vertical overlaps as the first_tile_in_row. As above, rows with
+        # no top overlap are fully opaque and skip the blend.
+        mask = None
         if first_tile_in_row.overlap.top > 0:
             assert first_tile_in_row.overlap.top >= blend_amount
-            blend_start_top = first_tile_in_row.overlap.top // 2 - blend_amount // 2
-            mask[:blend_start_top, :] = 0.0
-            mask[blend_start_top : blend_start_top + blend_amount, :] = gradient_top_y
-            # For visual debugging:
-            # row_image[blend_start_top : blend_start_top + blend_amount, :] = 0
+            mask = _get_linear_blend_mask(
+                row_image.shape[0], row_image.shape[1], first_tile_in_row.overlap.top, blend_amount, x_blend=False
+            )
         paste(
             dst_image=dst_image,
             src_image=row_image,
@@ -338,6 +370,62 @@ def merge_tiles_with_linear_blending(
         )
 
 
+@lru_cache(maxsize=8)
+def _get_gaussian_weights(tile_height: int, tile_width: int) -> np.ndarray:
+    """Build a separable 2D Gaussian weight kernel for Gaussian-weighted tile blending.
+
+    The weights peak at the tile center and fall off towards the tile edges, so that in overlap regions the tile
+    whose center is closest dominates. The kernel is strictly positive everywhere, which keeps the weighted average
+    well-defined for every covered pixel. Cached, since all tiles in a merge typically share the same shape.
+
+    Args:
+        tile_height (int): The tile height in px.
+        tile_width (int): The tile width in px.
+
+    Returns:
+        np.ndarray: The weight kernel. Range: (0.0, 1.0], Shape: (tile_height, tile_width).
+    """
+    # Standard deviation in normalized ([-1, 1]) tile coordinates. Chosen so that a tile edge has a small but
+    # non-negligible weight (exp(-2) ~= 0.14) relative to the tile center.
+    sigma = 0.5
+    gauss_y = np.exp(-0.5 * (np.linspace(-1.0, 1.0, num=tile_height) / sigma) ** 2)
+    gauss_x = np.exp(-0.5 * (np.linspace(-1.0, 1.0, num=tile_width) / sigma) ** 2)
+    weights = np.expand_dims(gauss_y, axis=1) * gauss_x
+
+    # The weights are shared across calls, so guard against accidental mutation by callers.
+    weights.flags.writeable = False
+    return weights
+
+
+def merge_tiles_with_gaussian_blending(dst_image: np.ndarray, tiles: list[Tile], tile_images: Iterable[np.ndarray]):
+    """Merge a set of image tiles into `dst_image` with Gaussian-weighted averaging between the tiles.
+
+    Every output pixel is the weighted average of all of the tiles that cover it, weighted by a Gaussian kernel
+    that peaks at each tile's center. Compared to the linear/seam strategies, this approach is branch-free, does
+    not require a minimum overlap, and is order-independent (tiles can be accumulated in any order), at the cost
+    of some softening in the overlap regions.
+
+    Args:
+        dst_image (np.ndarray): The destination image. Shape: (H, W, C).
+        tiles (list[Tile]): The list of tiles describing the locations of the respective `tile_images`.
+        tile_images (Iterable[np.ndarray]): The tile images to merge into `dst_image`. Each tile is consumed
+            immediately after it is accumulated, so a lazy iterable can be passed to avoid holding all of the tile
+            images in memory at once.
+    """
+    image_sum = np.zeros(shape=dst_image.shape, dtype=np.float64)
+    weight_sum = np.zeros(shape=(dst_image.shape[0], dst_image.shape[1], 1), dtype=np.float64)
+
+    for tile, tile_image in zip(tiles, tile_images, strict=True):
+        tile_height, tile_width, _ = tile_image.shape
+        weights = np.expand_dims(_get_gaussian_weights(tile_height, tile_width), axis=-1)
+        image_sum[tile.coords.top : tile.coords.bottom, tile.coords.left : tile.coords.right] += tile_image * weights
+        weight_sum[tile.coords.top : tile.coords.bottom, tile.coords.left : tile.coords.right] += weights
+
+    # Pixels that are not covered by any tile keep their dst_image value (a 0 weight would otherwise divide by zero).
+    covered = weight_sum[:, :, 0] > 0.0
+    dst_image[covered] = (image_sum[covered] / weight_sum[covered]).round().astype(dst_image.dtype)
+
+
 def merge_tiles_with_seam_blending(
     dst_image: np.ndarray, tiles: list[Tile], tile_images: list[np.ndarray], blend_amount: int
 ):
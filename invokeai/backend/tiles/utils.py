@@ -5,6 +5,12 @@ import cv2
 import numpy as np
 from pydantic import BaseModel, Field
 
+# BT.601 perceived-brightness coefficients, used to convert RGB overlaps to grey for seam finding.
+# Could offer other options for the luminance conversion
+# (BT.709 [0.2126, 0.7152, 0.0722], BT.2020 [0.2627, 0.6780, 0.0593])
+# it might not have a huge impact due to the blur that is applied over the seam.
+LUMINANCE_COEFFS = np.array([0.2989, 0.5870, 0.1140])
+
 
 class TBLR(BaseModel):
     top: int
@@ -46,7 +52,11 @@ def paste(dst_image: np.ndarray, src_image: np.ndarray, box: TBLR, mask: Optiona
     else:
         mask = np.expand_dims(mask, -1)
         dst_image_box = dst_image[box.top : box.bottom, box.left : box.right]
-        dst_image[box.top : box.bottom, box.left : box.right] = src_image * mask + dst_image_box * (1.0 - mask)
+        # Accumulate the blend in-place rather than as `src * mask + dst * (1 - mask)` to avoid allocating a second
+        # full-size float temporary.
+        blended = src_image * mask
+        blended += dst_image_box * (1.0 - mask)
+        dst_image[box.top : box.bottom, box.left : box.right] = blended
 
 
 def seam_blend(ia1: np.ndarray, ia2: np.ndarray, blend_amount: int, x_seam: bool) -> np.ndarray:
@@ -63,22 +73,9 @@ def seam_blend(ia1: np.ndarray, ia2: np.ndarray, blend_amount: int, x_seam: bool
     assert ia1.shape == ia2.shape
     assert ia2.size == ia2.size
 
-    def shift(arr, num, fill_value=255.0):
-        result = np.full_like(arr, fill_value)
-        if num > 0:
-            result[num:] = arr[:-num]
-        elif num < 0:
-            result[:num] = arr[-num:]
-        else:
-            result[:] = arr
-        return result
-
     # Assume RGB and convert to grey
-    # Could offer other options for the luminance conversion
-    # BT.709 [0.2126, 0.7152, 0.0722], BT.2020 [0.2627, 0.6780, 0.0593])
-    # it might not have a huge impact due to the blur that is applied over the seam
-    iag1 = np.dot(ia1, [0.2989, 0.5870, 0.1140])  # BT.601 perceived brightness
-    iag2 = np.dot(ia2, [0.2989, 0.5870, 0.1140])
+    iag1 = np.dot(ia1, LUMINANCE_COEFFS)
+    iag2 = np.dot(ia2, LUMINANCE_COEFFS)
 
     # Calc Difference between the images
     ia = iag2 - iag1
@@ -102,9 +99,14 @@ def seam_blend(ia1: np.ndarray, ia2: np.ndarray, blend_amount: int, x_seam: bool
     res = np.copy(energy)
     for y in range(1, max_y):
         row = res[y, :]
-        rowl = shift(row, -1)
-        rowr = shift(row, 1)
-        res[y, :] = res[y - 1, :] + np.min([row, rowl, rowr], axis=0)
+        # Minimum of each element and its left/right neighbors. The edges are treated as if padded with 255.0 to
+        # discourage the seam from hugging the image border.
+        neighbor_min = row.copy()
+        np.minimum(neighbor_min[:-1], row[1:], out=neighbor_min[:-1])
+        np.minimum(neighbor_min[1:], row[:-1], out=neighbor_min[1:])
+        neighbor_min[0] = min(neighbor_min[0], 255.0)
+        neighbor_min[-1] = min(neighbor_min[-1], 255.0)
+        res[y, :] = res[y - 1, :] + neighbor_min
 
     # create an array max_y long
     lowest_energy_line = np.empty([max_y], dtype="uint16")
@@ -120,11 +122,8 @@ def seam_blend(ia1: np.ndarray, ia2: np.ndarray, blend_amount: int, x_seam: bool
         rpos = np.clip(rpos, min_x, max_x - 1)
         lowest_energy_line[ypos] = np.argmin(energy[ypos, lpos : rpos + 1]) + lpos
 
-    # Draw the mask
-    mask = np.zeros_like(ia)
-    for ypos in range(0, max_y):
-        to_fill = lowest_energy_line[ypos]
-        mask[ypos, :to_fill] = 1
+    # Draw the mask. Each row is filled with 1s up to the seam position for that row.
+    mask = (np.arange(ia.shape[1])[None, :] < lowest_energy_line[:, None]).astype(ia.dtype)
 
     # If the seam is on the X-axis rotate the array back
     if x_seam:
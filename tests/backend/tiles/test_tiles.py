@@ -5,6 +5,7 @@ from invokeai.backend.tiles.tiles import (
     calc_tiles_even_split,
     calc_tiles_min_overlap,
     calc_tiles_with_overlap,
+    merge_tiles_with_gaussian_blending,
     merge_tiles_with_linear_blending,
 )
 from invokeai.backend.tiles.utils import TBLR, Tile
@@ -623,3 +624,176 @@ def test_merge_tiles_with_linear_blending_mismatched_list_lengths():
 
     with pytest.raises(ValueError):
         merge_tiles_with_linear_blending(dst_image=dst_image, tiles=tiles, tile_images=tile_images, blend_amount=0)
+
+
+#############################################
+# Test merge_tiles_with_gaussian_blending(...)
+#############################################
+
+
+def test_merge_tiles_with_gaussian_blending_uniform_tiles():
+    """Test that merge_tiles_with_gaussian_blending(...) produces a uniform output when all of the (overlapping) tiles
+    have the same uniform pixel value.
+    """
+    # Initialize 2 tiles side-by-side with overlap.
+    tiles = [
+        Tile(
+            coords=TBLR(top=0, bottom=512, left=0, right=512),
+            overlap=TBLR(top=0, bottom=0, left=0, right=64),
+        ),
+        Tile(
+            coords=TBLR(top=0, bottom=512, left=448, right=960),
+            overlap=TBLR(top=0, bottom=0, left=64, right=0),
+        ),
+    ]
+
+    dst_image = np.zeros((512, 960, 3), dtype=np.uint8)
+
+    # Prepare tile_images that match tiles. All tiles have the same uniform pixel value, so the weighted average in
+    # the overlap region must reproduce that value exactly.
+    tile_images = [
+        np.zeros((512, 512, 3)) + 64,
+        np.zeros((512, 512, 3)) + 64,
+    ]
+
+    expected_output = np.zeros((512, 960, 3), dtype=np.uint8) + 64
+
+    merge_tiles_with_gaussian_blending(dst_image=dst_image, tiles=tiles, tile_images=tile_images)
+
+    np.testing.assert_array_equal(dst_image, expected_output, strict=True)
+
+
+def test_merge_tiles_with_gaussian_blending_no_overlap():
+    """Test that merge_tiles_with_gaussian_blending(...) copies tiles exactly when there is no overlap."""
+    # Initialize 2 tiles side-by-side without overlap.
+    tiles = [
+        Tile(
+            coords=TBLR(top=0, bottom=512, left=0, right=512),
+            overlap=TBLR(top=0, bottom=0, left=0, right=0),
+        ),
+        Tile(
+            coords=TBLR(top=0, bottom=512, left=512, right=1024),
+            overlap=TBLR(top=0, bottom=0, left=0, right=0),
+        ),
+    ]
+
+    dst_image = np.zeros((512, 1024, 3), dtype=np.uint8)
+
+    # Prepare tile_images that match tiles. Pixel values are set based on the tile index.
+    tile_images = [
+        np.zeros((512, 512, 3)) + 64,
+        np.zeros((512, 512, 3)) + 128,
+    ]
+
+    # Without overlap, each pixel is covered by a single tile and should be copied exactly.
+    expected_output = np.zeros((512, 1024, 3), dtype=np.uint8)
+    expected_output[:, :512, :] = 64
+    expected_output[:, 512:, :] = 128
+
+    merge_tiles_with_gaussian_blending(dst_image=dst_image, tiles=tiles, tile_images=tile_images)
+
+    np.testing.assert_array_equal(dst_image, expected_output, strict=True)
+
+
+def test_merge_tiles_with_gaussian_blending_overlap_weighting():
+    """Test that merge_tiles_with_gaussian_blending(...) weights overlap pixels towards the nearest tile center."""
+    # Initialize 2 tiles side-by-side with overlap.
+    tiles = [
+        Tile(
+            coords=TBLR(top=0, bottom=512, left=0, right=512),
+            overlap=TBLR(top=0, bottom=0, left=0, right=64),
+        ),
+        Tile(
+            coords=TBLR(top=0, bottom=512, left=448, right=960),
+            overlap=TBLR(top=0, bottom=0, left=64, right=0),
+        ),
+    ]
+
+    dst_image = np.zeros((512, 960, 3), dtype=np.uint8)
+
+    # Prepare tile_images that match tiles. Pixel values are set based on the tile index.
+    tile_images = [
+        np.zeros((512, 512, 3)) + 64,
+        np.zeros((512, 512, 3)) + 128,
+    ]
+
+    merge_tiles_with_gaussian_blending(dst_image=dst_image, tiles=tiles, tile_images=tile_images)
+
+    # Non-overlapping regions are copied exactly.
+    np.testing.assert_array_equal(dst_image[:, :448, :], 64)
+    np.testing.assert_array_equal(dst_image[:, 512:, :], 128)
+
+    # In the overlap region, pixels near the left tile's center should be dominated by the left tile, and pixels near
+    # the right tile's center by the right tile.
+    assert np.all(dst_image[:, 448, :] < 96)
+    assert np.all(dst_image[:, 511, :] > 96)
+    # The blend must be monotonically non-decreasing from left to right across the overlap.
+    assert np.all(np.diff(dst_image[:, 448:512, 0].astype(np.int32), axis=1) >= 0)
+
+
+def test_merge_tiles_with_gaussian_blending_lazy_tile_images():
+    """Test that merge_tiles_with_gaussian_blending(...) accepts a lazy iterable of tile images."""
+    # Initialize 2 tiles side-by-side without overlap.
+    tiles = [
+        Tile(
+            coords=TBLR(top=0, bottom=512, left=0, right=512),
+            overlap=TBLR(top=0, bottom=0, left=0, right=0),
+        ),
+        Tile(
+            coords=TBLR(top=0, bottom=512, left=512, right=1024),
+            overlap=TBLR(top=0, bottom=0, left=0, right=0),
+        ),
+    ]
+
+    dst_image = np.zeros((512, 1024, 3), dtype=np.uint8)
+
+    # Pass the tile images as a generator rather than a list.
+    tile_images = (np.zeros((512, 512, 3)) + 64 * (i + 1) for i in range(2))
+
+    expected_output = np.zeros((512, 1024, 3), dtype=np.uint8)
+    expected_output[:, :512, :] = 64
+    expected_output[:, 512:, :] = 128
+
+    merge_tiles_with_gaussian_blending(dst_image=dst_image, tiles=tiles, tile_images=tile_images)
+
+    np.testing.assert_array_equal(dst_image, expected_output, strict=True)
+
+
+def test_merge_tiles_with_gaussian_blending_tiles_overflow_dst_image():
+    """Test that merge_tiles_with_gaussian_blending(...) raises an exception if any of the tiles overflows the
+    dst_image.
+    """
+    tiles = [
+        Tile(
+            coords=TBLR(top=0, bottom=512, left=0, right=512),
+            overlap=TBLR(top=0, bottom=0, left=0, right=0),
+        )
+    ]
+
+    dst_image = np.zeros((256, 512, 3), dtype=np.uint8)
+
+    # Prepare tile_images that match tiles.
+    tile_images = [np.zeros((512, 512, 3))]
+
+    with pytest.raises(ValueError):
+        merge_tiles_with_gaussian_blending(dst_image=dst_image, tiles=tiles, tile_images=tile_images)
+
+
+def test_merge_tiles_with_gaussian_blending_mismatched_list_lengths():
+    """Test that merge_tiles_with_gaussian_blending(...) raises an exception if the lengths of 'tiles' and
+    'tile_images' do not match.
+    """
+    tiles = [
+        Tile(
+            coords=TBLR(top=0, bottom=512, left=0, right=512),
+            overlap=TBLR(top=0, bottom=0, left=0, right=0),
+        )
+    ]
+
+    dst_image = np.zeros((256, 512, 3), dtype=np.uint8)
+
+    # tile_images is longer than tiles, so should cause an exception.
+    tile_images = [np.zeros((512, 512, 3)), np.zeros((512, 512, 3))]
+
+    with pytest.raises(ValueError):
+        merge_tiles_with_gaussian_blending(dst_image=dst_image, tiles=tiles, tile_images=tile_images)